@@ -1,3 +1,4 @@
+import itertools
 import json
 import logging
 import types
@@ -5,55 +6,156 @@ from datetime import datetime
 
 from . import easywork_core as _core
 
+ID_FORWARD = _core.ID_FORWARD
+
 _ACTIVE_PIPELINE = None
 _ACTIVE_BRANCH_CONTEXTS = []
 _LOG = logging.getLogger("easywork")
 
-def hash_string(s):
-    hash_val = 14695981039346656037
-    for char in s:
-        hash_val ^= ord(char)
-        hash_val *= 1099511628211
-        hash_val &= 0xFFFFFFFFFFFFFFFF # Force 64-bit
+_FNV_OFFSET = 14695981039346656037
+_FNV_PRIME = 1099511628211
+_U64_MASK = 0xFFFFFFFFFFFFFFFF
+
+def _hash_string_py(s):
+    # FNV-1a over the UTF-8 bytes, like easywork::hash_string for ASCII names.
+    hash_val = _FNV_OFFSET
+    prime = _FNV_PRIME
+    mask = _U64_MASK
+    for byte in s.encode("utf-8"):
+        hash_val = ((hash_val ^ byte) * prime) & mask
     return hash_val
 
+if hasattr(_core, "hash_string"):
+    hash_string = _core.hash_string
+else:
+    hash_string = _hash_string_py
+
+_METHOD_ID_CACHE = {}
+
+def _method_id_maps(exposed_methods):
+    """Return shared (name_to_id, id_to_name) dicts for a method-name set."""
+    key = tuple(exposed_methods)
+    maps = _METHOD_ID_CACHE.get(key)
+    if maps is None:
+        name_to_id = {name: hash_string(name) for name in key}
+        id_to_name = {method_id: name for name, method_id in name_to_id.items()}
+        id_to_name.setdefault(ID_FORWARD, "forward")
+        maps = (name_to_id, id_to_name)
+        _METHOD_ID_CACHE[key] = maps
+    return maps
+
+# (from_type, to_type) TypeInfo pairs the C++ converter registry has accepted.
+# Converters are only ever added, so positive answers stay valid; misses are
+# asked again. Keyed on TypeInfo itself: its hash is type_index::hash_code(),
+# which may collide, and __eq__ settles collisions.
+_CONVERTIBLE_PAIRS = set()
+
+_INTEGER_TYPE_NAMES = frozenset((
+    "int", "long", "long int", "long long", "long long int", "int64_t",
+))
+_CONDITION_TYPE_NAMES = _INTEGER_TYPE_NAMES | {"bool"}
+
+
+# TypeInfo -> (is_condition, is_integer); names are only inspected once per type.
+_CONDITION_KIND_CACHE = {}
+
+def _condition_kind(type_info):
+    kind = _CONDITION_KIND_CACHE.get(type_info)
+    if kind is None:
+        name = type_info.name
+        lowered = name.lower()
+        kind = _CONDITION_KIND_CACHE[type_info] = (
+            "pybind11::object" in name or lowered in _CONDITION_TYPE_NAMES,
+            lowered in _INTEGER_TYPE_NAMES,
+        )
+    return kind
+
+
+def _is_condition_type(type_info):
+    """Whether packets of this type can drive an IfNode or mux selector."""
+    return _condition_kind(type_info)[0]
+
+
+def _method_table(type_info):
+    """Flatten a NodeTypeInfo into per-method tuples for type validation.
+
+    {method_id: (input_types, input_ids, input_accepts_any, output_type, output_id)}
+    """
+    table = {}
+    for mid, info in type_info.methods.items():
+        input_types = info.input_types
+        output_type = info.output_type
+        table[mid] = (
+            input_types,
+            tuple(t.id for t in input_types),
+            tuple("pybind11::object" in t.name for t in input_types),
+            output_type,
+            output_type.id,
+        )
+    return table
+
+# C++ nodes take their method table from the static method registry of their
+# type, so every instance of a type shares one table. Python nodes are left
+# out: their type_name is a bare class name and need not be unique.
+_METHOD_TABLE_BY_TYPE = {}
+
+def _shared_method_table(raw, type_info=None):
+    """_method_table for a raw node, cached per C++ type_name."""
+    key = None if raw.is_python_node else raw.type_name
+    table = _METHOD_TABLE_BY_TYPE.get(key) if key is not None else None
+    if table is None:
+        table = _method_table(type_info if type_info is not None else raw.type_info)
+        if key is not None:
+            _METHOD_TABLE_BY_TYPE[key] = table
+    return table
+
+_TUPLE_SIZE_CACHE = {}
+
+def _tuple_size(type_info):
+    """Cached _core.get_tuple_size, keyed on the TypeInfo."""
+    size = _TUPLE_SIZE_CACHE.get(type_info)
+    if size is None:
+        size = _core.get_tuple_size(type_info)
+        # Tuple types can still be registered later; only remember hits.
+        if size > 0:
+            _TUPLE_SIZE_CACHE[type_info] = size
+    return size
+
 # ========== Symbol ==========
 class Symbol:
     """Represents a data flow connection between nodes."""
-    def __init__(self, producer_node, source_method_id=None, tuple_index=None):
+    __slots__ = ("producer_node", "source_method_id", "tuple_index", "output_type")
+
+    def __init__(self, producer_node, source_method_id=None, tuple_index=None, output_type=None):
         self.producer_node = producer_node
-        self.source_method_id = source_method_id if source_method_id is not None else _core.ID_FORWARD
+        self.source_method_id = source_method_id if source_method_id is not None else ID_FORWARD
         self.tuple_index = tuple_index
+        # Producer's output TypeInfo when already known (set on unpacked elements).
+        self.output_type = output_type
 
     def __iter__(self):
-        type_info = self.producer_node.type_info
+        producer_node = self.producer_node
+        pipeline = _ACTIVE_PIPELINE
+        if pipeline is not None:
+            type_info = pipeline._type_info_of(producer_node)
+        else:
+            type_info = producer_node.type_info
 
         if self.source_method_id not in type_info.methods:
              raise ValueError(f"Unknown source method ID {self.source_method_id}")
 
         output_type = type_info.methods[self.source_method_id].output_type
 
-        if not self._is_tuple_type(output_type):
+        num_elements = _tuple_size(output_type)
+        if num_elements <= 0:
             if "tuple" in output_type.name.lower() or "St4tuple" in output_type.name:
                  raise ValueError(f"Tuple type not registered: {output_type.name}")
             raise ValueError(f"Cannot unpack non-tuple type: {output_type.name}")
 
-        num_elements = self._get_tuple_size(output_type)
-        if num_elements <= 0:
-            raise ValueError(f"Tuple type not registered: {output_type.name}")
-
-        symbols = []
-        for i in range(num_elements):
-            symbol = Symbol(self.producer_node, self.source_method_id, tuple_index=i)
-            symbols.append(symbol)
-
-        return iter(symbols)
-
-    def _is_tuple_type(self, type_info):
-        return _core.get_tuple_size(type_info) > 0
-
-    def _get_tuple_size(self, type_info):
-        return _core.get_tuple_size(type_info)
+        source_method_id = self.source_method_id
+        return iter([
+            Symbol(producer_node, source_method_id, i, output_type) for i in range(num_elements)
+        ])
 
 class MuxSymbol:
     """Represents a conditional data flow (multiplexed)."""
@@ -84,6 +186,9 @@ class BranchCtx:
         self._pipeline = None
         self._if_node = None
         self._registered_nodes = set()
+        # Scopes carry no state of their own; one per label is enough.
+        self._true_scope = _BranchScope(self, "true")
+        self._false_scope = _BranchScope(self, "false")
 
     def __enter__(self):
         if _ACTIVE_PIPELINE is None:
@@ -98,7 +203,7 @@ class BranchCtx:
                 self._if_node.raw.set_input(self.cond.producer_node)
                 self._pipeline._record_connection(
                     self._if_node.raw,
-                    _core.ID_FORWARD,
+                    ID_FORWARD,
                     0,
                     self.cond.producer_node,
                     self.cond.source_method_id,
@@ -107,10 +212,10 @@ class BranchCtx:
                 self._if_node.raw.set_input(self.cond.raw)
                 self._pipeline._record_connection(
                     self._if_node.raw,
-                    _core.ID_FORWARD,
+                    ID_FORWARD,
                     0,
                     self.cond.raw,
-                    _core.ID_FORWARD,
+                    ID_FORWARD,
                 )
         _ACTIVE_BRANCH_CONTEXTS.append(self)
         return self
@@ -123,11 +228,11 @@ class BranchCtx:
 
     @property
     def true(self):
-        return _BranchScope(self, "true")
+        return self._true_scope
 
     @property
     def false(self):
-        return _BranchScope(self, "false")
+        return self._false_scope
 
     def assign(self, name, value):
         if self._active_branch == "true":
@@ -165,13 +270,11 @@ class BranchCtx:
         if node_wrapper in self._registered_nodes:
             return
         
-        try:
-            if_idx = self._pipeline._nodes.index(self._if_node)
-            node_idx = self._pipeline._nodes.index(node_wrapper)
-            if node_idx <= if_idx:
-                return
-        except ValueError:
-            pass
+        nodes = self._pipeline._nodes
+        if_pos = nodes.get(self._if_node)
+        node_pos = nodes.get(node_wrapper)
+        if if_pos is not None and node_pos is not None and node_pos <= if_pos:
+            return
 
         self._registered_nodes.add(node_wrapper)
         if self._active_branch == "true":
@@ -192,6 +295,18 @@ transform_function = _ast_transform.transform_function
 
 # ========== Node Wrapper ==========
 class NodeWrapper:
+    # Per-method-set subclasses (see _wrapper_class) add the exposed methods
+    # as class attributes and the shared name/id maps as class constants.
+    __slots__ = (
+        "raw", "pipeline", "built", "_registry_name", "_init_args", "_init_kwargs",
+        "_method_config", "_type_info", "_method_table", "__weakref__",
+    )
+
+    def __new__(cls, raw_node, *args, **kwargs):
+        if cls is NodeWrapper:
+            cls = _wrapper_class(raw_node.exposed_methods)
+        return super().__new__(cls)
+
     def __init__(self, raw_node, pipeline=None, registry_name=None, init_args=None, init_kwargs=None):
         self.raw = raw_node
         self.pipeline = pipeline
@@ -203,16 +318,9 @@ class NodeWrapper:
             "order": None,
             "queue_size": {},
         }
-        
-        self._method_name_to_id = {}
-        self._id_to_method_name = {}
-        for name in self.raw.exposed_methods:
-             h = hash_string(name)
-             self._method_name_to_id[name] = h
-             self._id_to_method_name[h] = name
-        
-        if _core.ID_FORWARD not in self._id_to_method_name:
-             self._id_to_method_name[_core.ID_FORWARD] = "forward"
+        # NodeTypeInfo is fixed once the C++ node exists; filled on first use.
+        self._type_info = None
+        self._method_table = None
 
     @property
     def registry_name(self):
@@ -230,7 +338,17 @@ class NodeWrapper:
 
     @property
     def type_info(self):
-        return self.raw.type_info
+        # Every raw.type_info access copies the whole NodeTypeInfo across the binding.
+        info = self._type_info
+        if info is None:
+            info = self._type_info = self.raw.type_info
+        return info
+
+    def _method_types(self):
+        table = self._method_table
+        if table is None:
+            table = self._method_table = _shared_method_table(self.raw, self._type_info)
+        return table
 
     @property
     def is_open(self):
@@ -246,20 +364,16 @@ class NodeWrapper:
         return self.__call__()
 
     def __getattr__(self, name):
-        # Check if it is a method
-        if name in self._method_name_to_id:
-            method_id = self._method_name_to_id[name]
-            return self._create_method_proxy(name, method_id)
-        
+        # Exposed methods are class attributes of the _wrapper_class subclass;
+        # anything else goes to the C++ node.
         return getattr(self.raw, name)
 
-    def _create_method_proxy(self, name, method_id):
-        def proxy(*args, **kwargs):
-            return self._connect(name, method_id, *args, **kwargs)
-        return proxy
-
     def __call__(self, *args, **kwargs):
-        return self._connect("forward", _core.ID_FORWARD, *args, **kwargs)
+        # Eager calls go straight to the C++ node; traced calls wire the graph.
+        pipeline = _ACTIVE_PIPELINE
+        if pipeline is None:
+            return self.raw.invoke("forward", *args, **kwargs)
+        return self._connect_traced(pipeline, "forward", ID_FORWARD, args, kwargs)
 
     def set_method_order(self, methods):
         self._method_config["order"] = list(methods)
@@ -272,111 +386,94 @@ class NodeWrapper:
     def _method_name_for_id(self, method_id):
         return self._id_to_method_name.get(method_id)
 
-    def _connect(self, method_name, method_id, *args, **kwargs):
-        if _ACTIVE_PIPELINE is None:
-             return self.raw.invoke(method_name, *args, **kwargs)
-
-        if self.raw.is_python_node:
+    def _connect_traced(self, pipeline, method_name, method_id, args, kwargs):
+        raw = self.raw
+        if raw.is_python_node:
             args = self._normalize_python_args(method_name, args, kwargs)
             kwargs = {}
         elif kwargs:
             raise TypeError("Kwargs are only supported for Python nodes inside Pipeline construction")
 
-        if self not in _ACTIVE_PIPELINE._nodes:
-            _ACTIVE_PIPELINE._nodes.append(self)
-        
+        id_forward = ID_FORWARD
+        pipeline._add_node(self)
+        direct_inputs = []
+        mux_inputs = pipeline._mux_inputs
         for idx, arg in enumerate(args):
-            upstream_node = None
-            upstream_method_id = _core.ID_FORWARD
-            
-            if isinstance(arg, MuxSymbol):
-                mux_key = (self.raw, method_id, idx)
-                if _ACTIVE_PIPELINE and mux_key in _ACTIVE_PIPELINE._connection_metadata:
-                    raise TypeError("Mux input cannot mix with direct connections")
-                if _ACTIVE_PIPELINE:
-                    _ACTIVE_PIPELINE._mux_inputs.add(mux_key)
-                control = arg.control_node.raw
-                control_type_info = control.type_info
-                if _core.ID_FORWARD not in control_type_info.methods:
-                    raise TypeError("Mux control must have a forward output")
-                control_output = control_type_info.methods[_core.ID_FORWARD].output_type
-                control_name = control_output.name.lower()
-                if "pybind11::object" not in control_output.name and control_name not in {"bool", "int", "long", "long int", "long long", "long long int", "int64_t"}:
-                    raise TypeError("Mux control packet must be bool or int")
-                raw_map = {}
-                for k, v in arg.mapping.items():
-                    if isinstance(v, Symbol):
-                        raw_map[k] = v.producer_node
-                        self.raw.set_weak_input(v.producer_node, idx)
-                        
-                        if _ACTIVE_PIPELINE:
-                             _ACTIVE_PIPELINE._record_connection(
-                                 self.raw, method_id, idx,
-                                 v.producer_node, v.source_method_id
-                             )
-                    elif isinstance(v, NodeWrapper):
-                        if _ACTIVE_PIPELINE and v not in _ACTIVE_PIPELINE._nodes:
-                            _ACTIVE_PIPELINE._nodes.append(v)
-                        raw_map[k] = v.raw
-                        self.raw.set_weak_input(v.raw, idx)
-                        
-                        if _ACTIVE_PIPELINE:
-                             _ACTIVE_PIPELINE._record_connection(
-                                 self.raw, method_id, idx,
-                                 v.raw, _core.ID_FORWARD
-                             )
-                
-                self.raw.set_input_mux(method_name, idx, control, raw_map)
-                if _ACTIVE_PIPELINE:
-                    _ACTIVE_PIPELINE._record_mux(self.raw, method_name, method_id, idx, control, raw_map)
-                continue
-
+            # Plain symbols are by far the most common argument; test them first.
             if isinstance(arg, Symbol):
                 upstream_node = arg.producer_node
-                upstream_method_id = arg.source_method_id
-                
-                if arg.tuple_index is not None:
-                     up_type = upstream_node.type_info.methods[upstream_method_id].output_type
-                     
-                     tuple_node_ptr = _core.create_tuple_get_node(up_type, arg.tuple_index)
-                     if _ACTIVE_PIPELINE:
-                         tuple_wrapper = _ACTIVE_PIPELINE._register_internal_node(tuple_node_ptr)
-                         tuple_wrapper.raw.set_input_for("forward", upstream_node)
-                         
-                         _ACTIVE_PIPELINE._record_connection(
-                             tuple_wrapper.raw, _core.ID_FORWARD, 0,
-                             upstream_node, upstream_method_id
-                         )
-                         
-                         upstream_node = tuple_wrapper.raw
-                         upstream_method_id = _core.ID_FORWARD
-                     else:
-                         raise RuntimeError("Tuple unpacking requires active pipeline context")
-
+                if arg.tuple_index is None:
+                    upstream_method_id = arg.source_method_id
+                else:
+                    upstream_node = pipeline._tuple_get_node(
+                        upstream_node, arg.source_method_id, arg.tuple_index, arg.output_type
+                    ).raw
+                    upstream_method_id = id_forward
             elif isinstance(arg, NodeWrapper):
-                if _ACTIVE_PIPELINE and arg not in _ACTIVE_PIPELINE._nodes:
-                    _ACTIVE_PIPELINE._nodes.append(arg)
-                
+                pipeline._add_node(arg)
                 upstream_node = arg.raw
-                upstream_method_id = _core.ID_FORWARD
-            
-            if upstream_node:
-                if _ACTIVE_PIPELINE:
-                    mux_key = (self.raw, method_id, idx)
-                    if mux_key in _ACTIVE_PIPELINE._mux_inputs:
-                        raise TypeError("Direct input cannot mix with mux connections")
-                self.raw.set_input_for(method_name, upstream_node, idx)
-                if _ACTIVE_PIPELINE:
-                    _ACTIVE_PIPELINE._record_connection(
-                        self.raw, method_id, idx,
-                        upstream_node, upstream_method_id
-                    )
+                upstream_method_id = id_forward
+            elif isinstance(arg, MuxSymbol):
+                self._connect_mux(pipeline, method_name, method_id, idx, arg)
+                continue
+            else:
+                continue
+
+            if (raw, method_id, idx) in mux_inputs:
+                raise TypeError("Direct input cannot mix with mux connections")
+            direct_inputs.append((upstream_node, idx))
+            pipeline._record_connection(
+                raw, method_id, idx,
+                upstream_node, upstream_method_id
+            )
+
+        if direct_inputs:
+            # Calling a node again with the same inputs describes the same edges;
+            # wiring them twice would only add duplicate upstream ports.
+            wiring = (raw, method_id, tuple(direct_inputs))
+            wired_calls = pipeline._wired_calls
+            if wiring not in wired_calls:
+                wired_calls.add(wiring)
+                raw.set_inputs_for(method_name, direct_inputs)
 
         if _ACTIVE_BRANCH_CONTEXTS:
             for ctx in _ACTIVE_BRANCH_CONTEXTS:
                 ctx._register_node(self)
 
-        return Symbol(self.raw, source_method_id=method_id)
+        return Symbol(raw, source_method_id=method_id)
+
+    def _connect_mux(self, pipeline, method_name, method_id, idx, arg):
+        raw = self.raw
+        id_forward = ID_FORWARD
+        if pipeline._has_connection(raw, method_id, idx):
+            raise TypeError("Mux input cannot mix with direct connections")
+        pipeline._mux_inputs.add((raw, method_id, idx))
+        control = arg.control_node.raw
+        control_type_info = arg.control_node.type_info
+        if id_forward not in control_type_info.methods:
+            raise TypeError("Mux control must have a forward output")
+        control_output = control_type_info.methods[id_forward].output_type
+        if not _is_condition_type(control_output):
+            raise TypeError("Mux control packet must be bool or int")
+        raw_map = {}
+        for k, v in arg.mapping.items():
+            if isinstance(v, Symbol):
+                raw_map[k] = v.producer_node
+                pipeline._record_connection(
+                    raw, method_id, idx,
+                    v.producer_node, v.source_method_id
+                )
+            elif isinstance(v, NodeWrapper):
+                pipeline._add_node(v)
+                raw_map[k] = v.raw
+                pipeline._record_connection(
+                    raw, method_id, idx,
+                    v.raw, id_forward
+                )
+
+        raw.set_weak_inputs(list(raw_map.values()), idx)
+        raw.set_input_mux(method_name, idx, control, raw_map)
+        pipeline._record_mux(raw, method_name, method_id, idx, control, raw_map)
 
     def _normalize_python_args(self, method_name, args, kwargs):
         if self.raw.method_has_varargs(method_name):
@@ -425,24 +522,87 @@ class NodeWrapper:
         return tuple(filled)
 
 
+_WRAPPER_CLASSES = {}
+
+def _make_method(name, method_id):
+    def method(self, *args, **kwargs):
+        pipeline = _ACTIVE_PIPELINE
+        if pipeline is None:
+            return self.raw.invoke(name, *args, **kwargs)
+        return self._connect_traced(pipeline, name, method_id, args, kwargs)
+    method.__name__ = name
+    method.__qualname__ = f"NodeWrapper.{name}"
+    return method
+
+
+def _wrapper_class(exposed_methods):
+    """Return the NodeWrapper subclass carrying methods for this method-name set.
+
+    Built once per distinct set, so every wrapper dispatches its methods
+    through plain class attribute lookup. Names NodeWrapper already defines
+    (open, close, read, ...) keep the base implementation.
+    """
+    key = tuple(exposed_methods)
+    cls = _WRAPPER_CLASSES.get(key)
+    if cls is None:
+        name_to_id, id_to_name = _method_id_maps(key)
+        namespace = {
+            "__module__": __name__,
+            "__qualname__": "NodeWrapper",
+            "__slots__": (),
+            # Shared per method-name set; treat as read-only.
+            "_method_name_to_id": name_to_id,
+            "_id_to_method_name": id_to_name,
+        }
+        for method_name, method_id in name_to_id.items():
+            if hasattr(NodeWrapper, method_name):
+                continue
+            namespace[method_name] = _make_method(method_name, method_id)
+        cls = _WRAPPER_CLASSES[key] = type("NodeWrapper", (NodeWrapper,), namespace)
+    return cls
+
+
 # ========== Pipeline ==========
 class Pipeline:
     def __init__(self):
         self._graph = _core.ExecutionGraph()
         self._executor = _core.Executor()
-        self._nodes = []
-        self._internal_nodes = []
-        self._validated = False
+        # Insertion-ordered sets: node -> insertion sequence number.
+        self._node_seq = itertools.count()
+        self._nodes = {}
+        self._raw_to_wrapper = {}
+        self._internal_nodes = {}
         self._has_run = False
+        # True while the traced construct() topology is still current; run()
+        # replays it instead of tracing again.
+        self._topology_current = False
         self._connection_metadata = {}
         self._mux_inputs = set()
         self._mux_metadata = []
+        self._tuple_get_cache = {}
+        self._wired_calls = set()
+        self._materialized_fingerprint = None
         self._graph.set_error_policy(_core.ErrorPolicy.FailFast)
 
+    # Framework bookkeeping: never a node and never invalidates the traced topology.
+    _INTERNAL_ATTRS = frozenset((
+        "_graph", "_executor", "_node_seq", "_nodes", "_raw_to_wrapper",
+        "_internal_nodes", "_has_run", "_topology_current",
+        "_connection_metadata", "_mux_inputs", "_mux_metadata", "_tuple_get_cache",
+        "_wired_calls", "_materialized_fingerprint", "_previous_pipeline",
+    ))
+
     def __setattr__(self, name, value):
-        if isinstance(value, NodeWrapper):
-            if hasattr(self, "_nodes") and value not in self._nodes:
-                self._nodes.append(value)
+        if name in Pipeline._INTERNAL_ATTRS:
+            object.__setattr__(self, name, value)
+            return
+        # Attributes set before __init__ finishes (no _nodes yet) are not tracked.
+        if "_nodes" in self.__dict__:
+            if isinstance(value, NodeWrapper):
+                self._add_node(value)
+            # construct() may read any user attribute (nodes, PythonNodes,
+            # plain settings), so the traced topology is stale after this.
+            self.__dict__["_topology_current"] = False
         super().__setattr__(name, value)
     
     def __enter__(self):
@@ -463,21 +623,45 @@ class Pipeline:
     def get_error_policy(self):
         return self._graph.get_error_policy()
 
+    def _add_node(self, node):
+        nodes = self._nodes
+        if node not in nodes:
+            nodes[node] = next(self._node_seq)
+            self._raw_to_wrapper[node.raw] = node
+
     def _record_connection(self, consumer, consumer_method, input_idx, producer, producer_method):
-        if consumer.type_name == "IfNode" and consumer_method == _core.ID_FORWARD and input_idx == 0:
-            if producer_method not in producer.type_info.methods:
+        if consumer_method == ID_FORWARD and input_idx == 0 and isinstance(consumer, _core.IfNode):
+            producer_methods = self._type_info_of(producer).methods
+            if producer_method not in producer_methods:
                 raise TypeError("IfNode condition must be bool or int")
-            producer_type = producer.type_info.methods[producer_method].output_type
-            name = producer_type.name.lower()
-            if "pybind11::object" not in producer_type.name and name not in {"bool", "int", "long", "long int", "long long", "long long int", "int64_t"}:
+            if not _is_condition_type(producer_methods[producer_method].output_type):
                 raise TypeError("IfNode condition must be bool or int")
-        key = (consumer, consumer_method, input_idx)
+        # consumer -> {(method_id, input_idx): [(producer, producer_method), ...]}
+        ports = self._connection_metadata.get(consumer)
+        if ports is None:
+            ports = self._connection_metadata[consumer] = {}
+        producers = ports.get((consumer_method, input_idx))
+        if producers is None:
+            producers = ports[(consumer_method, input_idx)] = []
         val = (producer, producer_method)
-        if key not in self._connection_metadata:
-            self._connection_metadata[key] = []
-        if val in self._connection_metadata[key]:
+        if val in producers:
             return
-        self._connection_metadata[key].append(val)
+        producers.append(val)
+
+    def _type_info_of(self, raw):
+        wrapper = self._raw_to_wrapper.get(raw)
+        if wrapper is None:
+            return raw.type_info
+        return wrapper.type_info
+
+    def _has_connection(self, consumer, method_id, input_idx):
+        ports = self._connection_metadata.get(consumer)
+        return ports is not None and (method_id, input_idx) in ports
+
+    def _iter_connections(self):
+        for consumer, ports in self._connection_metadata.items():
+            for (method_id, input_idx), producers in ports.items():
+                yield consumer, method_id, input_idx, producers
 
     def _record_mux(self, consumer, method_name, method_id, arg_idx, control, mapping):
         self._mux_metadata.append({
@@ -495,15 +679,20 @@ class Pipeline:
     def _clear_topology(self):
         self._reset_connections()
         self._nodes.clear()
+        self._raw_to_wrapper.clear()
         self._clear_internal_nodes()
         self._connection_metadata.clear()
         self._mux_inputs.clear()
         self._mux_metadata.clear()
+        self._tuple_get_cache.clear()
+        self._wired_calls.clear()
 
     def _build_topology(self):
-        is_default_construct = self.construct.__func__ is Pipeline.construct
+        is_default_construct = type(self).construct is Pipeline.construct
         if self._nodes and is_default_construct:
             _LOG.info("Detected external graph construction, preserving nodes")
+            # Connections were recorded as they were made; nothing to re-trace.
+            self._topology_current = True
             return
 
         self._clear_topology()
@@ -512,12 +701,17 @@ class Pipeline:
             construct_fn = transform_function(construct_fn, strict=True)
         construct_fn = types.MethodType(construct_fn, self)
         self._with_active_pipeline(construct_fn)
+        self._topology_current = True
+
+    def invalidate(self):
+        """Force the next run() to trace construct() again and rebuild its tasks."""
+        self._topology_current = False
+        self._materialized_fingerprint = None
 
     def validate(self):
         _LOG.info("Validating graph types")
         self._build_topology()
         self._validate_types()
-        self._validated = True
         return True
 
     def _assert_exportable(self):
@@ -578,8 +772,8 @@ class Pipeline:
             })
 
         edges = []
-        raw_to_wrapper = {node.raw: node for node in self._nodes}
-        for (consumer, method_id, input_idx), producers in self._connection_metadata.items():
+        raw_to_wrapper = self._raw_to_wrapper
+        for consumer, method_id, input_idx, producers in self._iter_connections():
             for producer, producer_method in producers:
                 if (consumer, method_id, input_idx, producer) in mux_edges:
                     continue
@@ -637,65 +831,75 @@ class Pipeline:
     def _validate_types(self):
         if hasattr(_core, "register_arithmetic_conversions"):
             _core.register_arithmetic_conversions()
-        raw_to_wrapper = {node.raw: node for node in self._nodes}
+        raw_to_wrapper = self._raw_to_wrapper
+        id_forward = ID_FORWARD
+        can_convert = getattr(_core, "can_convert", None)
+        if_node_cls = _core.IfNode
 
-        def _is_convertible(from_type, to_type):
-            if from_type == to_type:
+        def _is_convertible(from_type, from_id, to_type, to_id, to_any):
+            if to_any:
+                return True
+            # TypeInfo.id is type_index::hash_code(): different ids always mean
+            # different types, but equal ids may collide, so confirm with ==.
+            if from_id == to_id and from_type == to_type:
                 return True
-            if "pybind11::object" in to_type.name:
+            pair = (from_type, to_type)
+            if pair in _CONVERTIBLE_PAIRS:
+                return True
+            if can_convert is not None and can_convert(from_type, to_type):
+                _CONVERTIBLE_PAIRS.add(pair)
                 return True
-            if hasattr(_core, "can_convert"):
-                return _core.can_convert(from_type, to_type)
             return False
 
-        def _is_if_condition_type(type_info):
-            name = type_info.name.lower()
-            if "pybind11::object" in type_info.name:
-                return True
-            return name in {"bool", "int", "long", "long int", "long long", "long long int", "int64_t"}
-
-        for (consumer, method_id, input_idx), producers in self._connection_metadata.items():
-            type_info = consumer.type_info
-            if method_id not in type_info.methods:
-                method_name = str(method_id)
-                wrapper = raw_to_wrapper.get(consumer)
-                if wrapper:
-                    method_name = wrapper._id_to_method_name.get(method_id, method_name)
-                raise TypeError(f"Method not found: {method_name}")
-
-            method_info = type_info.methods[method_id]
-            if input_idx >= len(method_info.input_types):
-                method_name = str(method_id)
-                wrapper = raw_to_wrapper.get(consumer)
-                if wrapper:
-                    method_name = wrapper._id_to_method_name.get(method_id, method_name)
+        def _method_label(consumer, method_id):
+            wrapper = raw_to_wrapper.get(consumer)
+            if wrapper:
+                return wrapper._id_to_method_name.get(method_id, str(method_id))
+            return str(method_id)
+
+        def _methods_of(raw):
+            wrapper = raw_to_wrapper.get(raw)
+            if wrapper is None:
+                return _shared_method_table(raw)
+            return wrapper._method_types()
+
+        for consumer, method_id, input_idx, producers in self._iter_connections():
+            consumer_methods = _methods_of(consumer)
+            if method_id not in consumer_methods:
+                raise TypeError(f"Method not found: {_method_label(consumer, method_id)}")
+
+            input_types, input_ids, input_any = consumer_methods[method_id][:3]
+            if input_idx >= len(input_types):
                 raise TypeError(
-                    f"Type mismatch on method '{method_name}': argument index out of range"
+                    f"Type mismatch on method '{_method_label(consumer, method_id)}': "
+                    "argument index out of range"
                 )
 
-            expected_type = method_info.input_types[input_idx]
+            expected_type = input_types[input_idx]
+            expected_id = input_ids[input_idx]
+            expected_any = input_any[input_idx]
             producer_types = []
             for producer, producer_method in producers:
-                producer_type_info = producer.type_info
-                if producer_method not in producer_type_info.methods:
+                producer_methods = _methods_of(producer)
+                if producer_method not in producer_methods:
                     producer_type = _core.TypeInfo()
+                    producer_types.append((producer_type, producer_type.id))
                 else:
-                    producer_type = producer_type_info.methods[producer_method].output_type
-                producer_types.append(producer_type)
+                    producer_types.append(producer_methods[producer_method][3:])
 
-            for producer_type in producer_types:
-                if consumer.type_name == "IfNode" and method_id == _core.ID_FORWARD and input_idx == 0:
-                    if not _is_if_condition_type(producer_type):
+            is_if_condition = (
+                method_id == id_forward and input_idx == 0 and isinstance(consumer, if_node_cls)
+            )
+            for producer_type, producer_id in producer_types:
+                if is_if_condition:
+                    is_condition, is_integer = _condition_kind(producer_type)
+                    if not is_condition:
                         raise TypeError("IfNode condition must be bool or int")
-                    if producer_type.name.lower() in {"int", "long", "long int", "long long", "long long int", "int64_t"}:
+                    if is_integer:
                         continue
-                if not _is_convertible(producer_type, expected_type):
-                    method_name = str(method_id)
-                    wrapper = raw_to_wrapper.get(consumer)
-                    if wrapper:
-                        method_name = wrapper._id_to_method_name.get(method_id, method_name)
+                if not _is_convertible(producer_type, producer_id, expected_type, expected_id, expected_any):
                     raise TypeError(
-                        "Type mismatch on method '" + method_name +
+                        "Type mismatch on method '" + _method_label(consumer, method_id) +
                         "': expected " + expected_type.name +
                         ", got " + producer_type.name
                     )
@@ -709,44 +913,76 @@ class Pipeline:
             node.close()
 
     def _ensure_all_open(self):
-        internal_nodes = set(getattr(self, "_internal_nodes", []))
-        not_open = [node for node in self._nodes
-                    if node not in internal_nodes and not node.is_open]
+        internal_nodes = getattr(self, "_internal_nodes", {})
+        not_open = _core.collect_closed_nodes(
+            [node.raw for node in self._nodes if node not in internal_nodes]
+        )
         if not_open:
-            names = ", ".join(str(n) for n in not_open)
+            names = ", ".join(n.type_name for n in not_open)
             raise RuntimeError(f"All nodes must be opened before run(). Closed nodes: {names}")
 
     def run(self):
-        if not self._validated:
+        verbose = _LOG.isEnabledFor(logging.INFO)
+        if not self._topology_current:
             self._build_topology()
 
-        if self._has_run:
-            _LOG.info("Resetting Graph for re-run")
-            self._graph.reset()
-            for node in self._nodes:
-                node.built = False
+        fingerprint = self._topology_fingerprint()
+        if self._has_run and fingerprint == self._materialized_fingerprint:
+            if verbose:
+                _LOG.info("Topology unchanged, reusing materialized Graph")
+            self._graph.rewind()
+        else:
+            nodes = self._nodes
+            raws = [node.raw for node in nodes]
+            if self._has_run:
+                if verbose:
+                    _LOG.info("Resetting Graph for re-run")
+                self._graph.reset()
+                build_nodes = raws
+            else:
+                build_nodes = [node.raw for node in nodes if not node.built]
 
-        _LOG.info("Materializing Graph (%d nodes)", len(self._nodes))
-        for node in self._nodes:
-            if not node.built:
-                node.raw.build(self._graph)
+            if verbose:
+                _LOG.info("Materializing Graph (%d nodes)", len(nodes))
+            self._executor.materialize(self._graph, build_nodes, raws)
+            for node in nodes:
                 node.built = True
-
-        _LOG.info("Connecting Edges")
-        for node in self._nodes:
-            node.raw.connect()
-
-        for node in self._nodes:
-            node.raw.activate()
+            self._materialized_fingerprint = fingerprint
 
         self._ensure_all_open()
-        _LOG.info("Starting Executor")
+        if verbose:
+            _LOG.info("Starting Executor")
         try:
             self._executor.run(self._graph)
         except KeyboardInterrupt:
             _LOG.warning("Stopping on KeyboardInterrupt")
         self._has_run = True
-        self._validated = False
+
+    def _topology_fingerprint(self):
+        """Structural key of the current topology, compared against the last materialized one.
+
+        Holds the node handles themselves rather than id()s, so a freed node's
+        address being reused cannot produce a false match.
+
+        Built only from Python-side state (wrapper connections, mux metadata and
+        NodeWrapper.set_method_order). Changes made directly on raw nodes, such
+        as node.raw.set_input(...) or node.raw.set_method_order(...), are not
+        seen; call invalidate() after them so the next run() rebuilds.
+        """
+        nodes = tuple(node.raw for node in self._nodes)
+        connections = tuple(
+            (consumer, method_id, input_idx, tuple(producers))
+            for consumer, method_id, input_idx, producers in self._iter_connections()
+        )
+        mux = tuple(
+            (entry["consumer"], entry["method_id"], entry["arg_idx"], entry["control"],
+             tuple(sorted(entry["map"].items())))
+            for entry in self._mux_metadata
+        )
+        orders = tuple(
+            tuple(node._method_config["order"] or ()) for node in self._nodes
+        )
+        return (nodes, connections, mux, orders)
 
     def _with_active_pipeline(self, fn):
         global _ACTIVE_PIPELINE
@@ -766,47 +1002,91 @@ class Pipeline:
         except Exception:
             registry_name = None
         wrapper = NodeWrapper(cpp_node, registry_name=registry_name)
-        self._internal_nodes.append(wrapper)
-        if wrapper not in self._nodes:
-            self._nodes.append(wrapper)
+        self._internal_nodes[wrapper] = None
+        self._add_node(wrapper)
         return wrapper
 
+    def _tuple_get_node(self, upstream_node, upstream_method_id, tuple_index, up_type=None):
+        # One TupleGet node per unpacked element, shared by all its consumers.
+        key = (upstream_node, upstream_method_id, tuple_index)
+        tuple_wrapper = self._tuple_get_cache.get(key)
+        if tuple_wrapper is not None:
+            return tuple_wrapper
+        if up_type is None:
+            up_type = self._type_info_of(upstream_node).methods[upstream_method_id].output_type
+        tuple_node_ptr = _core.create_tuple_get_node(up_type, tuple_index)
+        tuple_wrapper = self._register_internal_node(tuple_node_ptr)
+        tuple_wrapper.raw.set_input_for("forward", upstream_node)
+        self._record_connection(
+            tuple_wrapper.raw, ID_FORWARD, 0,
+            upstream_node, upstream_method_id
+        )
+        self._tuple_get_cache[key] = tuple_wrapper
+        return tuple_wrapper
+
     def _clear_internal_nodes(self):
         if not hasattr(self, "_internal_nodes"):
-            self._internal_nodes = []
+            self._internal_nodes = {}
         if not self._internal_nodes:
             return
         for node in self._internal_nodes:
-            if node in self._nodes:
-                self._nodes.remove(node)
-        self._internal_nodes = []
+            self._nodes.pop(node, None)
+            self._raw_to_wrapper.pop(node.raw, None)
+        self._internal_nodes = {}
 
     def _reset_connections(self):
         for node in self._nodes:
             node.raw.clear_upstreams()
 
+def _check_number_source_args(args, kwargs):
+    step_value = None
+    if len(args) >= 3:
+        step_value = args[2]
+    elif "step" in kwargs:
+        step_value = kwargs["step"]
+    if step_value is not None:
+        if not isinstance(step_value, int):
+            raise RuntimeError("Failed to parse argument 'step'")
+        if step_value == 0:
+            raise RuntimeError("NumberSource step cannot be 0")
+
+
+# Extra Python-side argument checks, looked up once per factory.
+_FACTORY_ARG_CHECKS = {
+    "NumberSource": _check_number_source_args,
+}
+
+
 class ModuleProxy:
     def __getattr__(self, name):
+        # Dunder probes (copy, pickle, inspect, pytest) are never node types;
+        # reject them without a registry round-trip.
+        if name.startswith("__"):
+            raise AttributeError(name)
         if _core._NodeRegistry.instance().is_registered(name):
+            check_args = _FACTORY_ARG_CHECKS.get(name)
+
             def factory(*args, **kwargs):
-                if name == "NumberSource":
-                    step_value = None
-                    if len(args) >= 3:
-                        step_value = args[2]
-                    elif "step" in kwargs:
-                        step_value = kwargs["step"]
-                    if step_value is not None:
-                        if not isinstance(step_value, int):
-                            raise RuntimeError("Failed to parse argument 'step'")
-                        if step_value == 0:
-                            raise RuntimeError("NumberSource step cannot be 0")
+                if check_args is not None:
+                    check_args(args, kwargs)
                 node = _core.create_node(name, *args, **kwargs)
                 return NodeWrapper(node, registry_name=name, init_args=args, init_kwargs=kwargs)
+            # Registered names are never removed, so later lookups can skip __getattr__.
+            self.__dict__[name] = factory
             return factory
         raise AttributeError(f"Node type '{name}' not found")
 
+    # (registry generation, node names) from the last __dir__ call.
+    _dir_cache = (None, ())
+
     def __dir__(self):
-        return _core._NodeRegistry.instance().registered_nodes()
+        registry = _core._NodeRegistry.instance()
+        generation = registry.generation
+        cached_generation, names = ModuleProxy._dir_cache
+        if cached_generation != generation:
+            names = tuple(registry.registered_nodes())
+            ModuleProxy._dir_cache = (generation, names)
+        return names
 
 module = ModuleProxy()
 
@@ -59,7 +59,7 @@ std::vector<easywork::Packet> BuildInputsForMethod(
     std::vector<easywork::Packet> inputs;
     inputs.reserve(args.size());
 
-    auto type_info = node.get_type_info();
+    const auto& type_info = node.cached_type_info();
     auto it = type_info.methods.find(method_id);
     if (it != type_info.methods.end()) {
         if (it->second.input_types.size() != args.size()) {
@@ -99,11 +99,10 @@ py::object FromPacket(const easywork::Packet& packet) {
     if (!packet.has_value()) {
         return py::none();
     }
-    auto type_info = packet.type();
     const auto& registry = easywork::AnyToPyRegistry();
-    auto it = registry.find(type_info.type_index);
+    auto it = registry.find(std::type_index(packet.data().type()));
     if (it == registry.end()) {
-        throw std::runtime_error("No Python converter registered for type: " + type_info.type_name);
+        throw std::runtime_error("No Python converter registered for type: " + packet.type().type_name);
     }
     return it->second(packet.data());
 }
@@ -116,6 +115,9 @@ struct PyMethodMeta {
     std::vector<bool> has_default;
     bool has_varargs{false};
     bool has_varkw{false};
+    // Resolved once in AddMethod: the bound method and its Signature.bind.
+    py::object callable;
+    py::object bind;
 };
 
 class PyNode : public easywork::Node {
@@ -222,9 +224,8 @@ public:
             throw std::runtime_error("Method not found in Python node: " + std::to_string(method_id));
         }
         py::gil_scoped_acquire gil;
-        py::object callable = instance_.attr(it->second.name.c_str());
-        ValidateSignature(callable, args, kwargs);
-        py::object result = callable(*args, **kwargs);
+        it->second.bind(*args, **kwargs);
+        py::object result = it->second.callable(*args, **kwargs);
         if (result.is_none()) {
             return easywork::Packet::Empty();
         }
@@ -287,6 +288,8 @@ private:
         bool first = true;
         PyMethodMeta meta;
         meta.name = name;
+        meta.callable = callable;
+        meta.bind = signature.attr("bind");
         for (const auto& param : values) {
             py::object kind = param.attr("kind");
             if (kind.is(kind_var_pos)) {
@@ -319,13 +322,6 @@ private:
         return meta;
     }
 
-    void ValidateSignature(const py::object& callable, const py::args& args, const py::kwargs& kwargs) const {
-        py::module_ inspect = py::module_::import("inspect");
-        py::object signature = inspect.attr("signature")(callable);
-        py::object bind = signature.attr("bind");
-        bind(*args, **kwargs);
-    }
-
 
     size_t MethodIdForName(const std::string& name) const {
         if (name == "forward") {
@@ -349,12 +345,11 @@ private:
             throw std::runtime_error("Python node argument count mismatch for method: " + it->second.name);
         }
         py::gil_scoped_acquire gil;
-        py::object callable = instance_.attr(it->second.name.c_str());
         py::tuple py_args(inputs.size());
         for (size_t i = 0; i < inputs.size(); ++i) {
             py_args[i] = FromPacket(inputs[i]);
         }
-        py::object result = callable(*py_args);
+        py::object result = it->second.callable(*py_args);
         if (result.is_none()) {
             return easywork::Packet::Empty();
         }
@@ -383,7 +378,7 @@ private:
     }
 
     int DecodeMuxChoice(const easywork::Packet& control_pkt) const {
-        if (control_pkt.type() == easywork::TypeInfo::create<py::object>()) {
+        if (control_pkt.holds<py::object>()) {
             py::object control_obj = FromPacket(control_pkt);
             if (py::isinstance<py::bool_>(control_obj)) {
                 return control_obj.cast<bool>() ? 0 : 1;
@@ -445,6 +440,9 @@ PYBIND11_MODULE(easywork_core, m) {
     m.attr("ID_FORWARD") = easywork::ID_FORWARD;
     m.attr("ID_OPEN") = easywork::ID_OPEN;
     m.attr("ID_CLOSE") = easywork::ID_CLOSE;
+    m.def("hash_string", [](const std::string& name) {
+        return easywork::hash_string(name);
+    });
 
     py::enum_<easywork::ErrorPolicy>(m, "ErrorPolicy")
         .value("FailFast", easywork::ErrorPolicy::FailFast)
@@ -470,15 +468,31 @@ PYBIND11_MODULE(easywork_core, m) {
     
     py::class_<easywork::TypeInfo>(m, "TypeInfo")
         .def_readonly("name", &easywork::TypeInfo::type_name)
+        .def_property_readonly("id", [](const easywork::TypeInfo& self) {
+            return self.type_index.hash_code();
+        })
         .def("__eq__", &easywork::TypeInfo::operator==)
         .def("__ne__", &easywork::TypeInfo::operator!=)
+        .def("__hash__", [](const easywork::TypeInfo& self) {
+            return self.type_index.hash_code();
+        })
         .def("__repr__", [](const easywork::TypeInfo& self) {
             return "<TypeInfo: " + self.type_name + ">";
         });
 
     py::class_<easywork::MethodInfo>(m, "MethodInfo")
-        .def_readonly("input_types", &easywork::MethodInfo::input_types)
-        .def_readonly("output_type", &easywork::MethodInfo::output_type)
+        // Read-only view: hand back a tuple instead of building a list per access.
+        .def_property_readonly("input_types", [](const easywork::MethodInfo& self) {
+            py::tuple types(self.input_types.size());
+            for (size_t i = 0; i < self.input_types.size(); ++i) {
+                types[i] = py::cast(self.input_types[i]);
+            }
+            return types;
+        })
+        // By value like input_types, so a cached TypeInfo does not pin its node.
+        .def_property_readonly("output_type", [](const easywork::MethodInfo& self) {
+            return self.output_type;
+        })
         .def("__repr__", [](const easywork::MethodInfo& self) {
             std::string s = "([";
             for (size_t i = 0; i < self.input_types.size(); ++i) {
@@ -499,6 +513,7 @@ PYBIND11_MODULE(easywork_core, m) {
     py::class_<easywork::ExecutionGraph>(m, "ExecutionGraph")
         .def(py::init<>())
         .def("reset", &easywork::ExecutionGraph::Reset)
+        .def("rewind", &easywork::ExecutionGraph::Rewind)
         .def("set_error_policy", &easywork::ExecutionGraph::SetErrorPolicy)
         .def("get_error_policy", &easywork::ExecutionGraph::GetErrorPolicy)
         .def("last_error", &easywork::ExecutionGraph::LastError)
@@ -511,7 +526,9 @@ PYBIND11_MODULE(easywork_core, m) {
         .def("run", &easywork::Executor::run,
              py::call_guard<py::gil_scoped_release>())
         .def("open", &easywork::Executor::open)
-        .def("close", &easywork::Executor::close);
+        .def("close", &easywork::Executor::close)
+        .def("materialize", &easywork::Executor::materialize,
+             py::arg("graph"), py::arg("build_nodes"), py::arg("nodes"));
 
     py::class_<easywork::Node::UpstreamConnection>(m, "UpstreamConnection")
         .def_readonly("node", &easywork::Node::UpstreamConnection::node, py::return_value_policy::reference)
@@ -555,13 +572,16 @@ PYBIND11_MODULE(easywork_core, m) {
         })
         .def("set_input", &easywork::Node::set_input, py::arg("upstream"), py::arg("arg_idx") = -1)
         .def("set_weak_input", &easywork::Node::set_weak_input, py::arg("upstream"), py::arg("arg_idx") = -1)
+        .def("set_weak_inputs", &easywork::Node::set_weak_inputs, py::arg("upstreams"), py::arg("arg_idx") = -1)
         .def("set_input_for", &easywork::Node::set_input_for, py::arg("method"), py::arg("upstream"), py::arg("arg_idx") = -1)
+        .def("set_inputs_for", &easywork::Node::set_inputs_for, py::arg("method"), py::arg("inputs"))
         .def("set_input_mux", &easywork::Node::SetInputMux, py::arg("method"), py::arg("arg_idx"), py::arg("control"), py::arg("map"))
         .def("clear_upstreams", &easywork::Node::ClearUpstreams)
         .def("set_method_order", &easywork::Node::SetMethodOrder)
         .def("set_method_queue_size", &easywork::Node::SetMethodQueueSize)
         .def_property_readonly("type_name", &easywork::Node::type_name)
-        .def_property_readonly("type_info", &easywork::Node::get_type_info)
+        .def_property_readonly("type_info", &easywork::Node::cached_type_info,
+                               py::return_value_policy::reference_internal)
         .def_property_readonly("exposed_methods", &easywork::Node::exposed_methods)
         .def_property_readonly("upstreams", &easywork::Node::get_upstreams)
         .def_property_readonly("connections", [](const easywork::Node& self) {
@@ -604,7 +624,8 @@ PYBIND11_MODULE(easywork_core, m) {
     py::class_<easywork::NodeRegistry>(m, "_NodeRegistry")
         .def_static("instance", &easywork::NodeRegistry::instance, py::return_value_policy::reference)
         .def("registered_nodes", &easywork::NodeRegistry::RegisteredNodes)
-        .def("is_registered", &easywork::NodeRegistry::IsRegistered);
+        .def("is_registered", &easywork::NodeRegistry::IsRegistered)
+        .def_property_readonly("generation", &easywork::NodeRegistry::Generation);
 
     m.def("create_node", [](const std::string& name, py::args args, py::kwargs kwargs) {
         return easywork::NodeRegistry::instance().Create(name, args, kwargs);
@@ -625,6 +646,16 @@ PYBIND11_MODULE(easywork_core, m) {
             });
     });
 
+    m.def("collect_closed_nodes", [](const std::vector<easywork::Node*>& nodes) {
+        py::list closed;
+        for (auto* node : nodes) {
+            if (node && !node->IsOpen()) {
+                closed.append(py::cast(node, py::return_value_policy::reference));
+            }
+        }
+        return closed;
+    });
+
     // ========== Tuple Helpers ==========
 
     m.def("create_tuple_get_node", &easywork::CreateTupleGetNode);
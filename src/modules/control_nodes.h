@@ -103,12 +103,11 @@ private:
 
             bool cond = false;
             if (packet.has_value()) {
-                const auto packet_type = packet.type();
-                if (packet_type == TypeInfo::create<bool>()) {
+                if (packet.holds<bool>()) {
                     cond = packet.cast<bool>();
-                } else if (packet_type == TypeInfo::create<int>()) {
+                } else if (packet.holds<int>()) {
                     cond = packet.cast<int>() != 0;
-                } else if (packet_type == TypeInfo::create<int64_t>()) {
+                } else if (packet.holds<int64_t>()) {
                     cond = packet.cast<int64_t>() != 0;
                 } else {
                     throw std::runtime_error("IfNode condition must be bool or int");
@@ -184,33 +184,43 @@ public:
         // If left or right were not called before forward (when they should have been),
         // we count it as an order error (assuming the test sets up data for all ports).
         if (!left_ready_ || !right_ready_) {
-            ++order_error_count;
+            error_counts.order.fetch_add(1, std::memory_order_relaxed);
         }
         left_ready_ = false;
         right_ready_ = false;
-        ++forward_count;
+        method_counts.forward.fetch_add(1, std::memory_order_relaxed);
         return input;
     }
 
     int left(int input) {
         left_ready_ = true;
-        ++left_count;
+        method_counts.left.fetch_add(1, std::memory_order_relaxed);
         return input;
     }
 
     int right(int input) {
         right_ready_ = true;
-        ++right_count;
+        method_counts.right.fetch_add(1, std::memory_order_relaxed);
         return input;
     }
 
     // Export all methods
     EW_ENABLE_METHODS(forward, left, right)
 
-    static inline std::atomic<int> left_count{0};
-    static inline std::atomic<int> right_count{0};
-    static inline std::atomic<int> forward_count{0};
-    static inline std::atomic<int> order_error_count{0};
+    // Statistics only, so increments are relaxed. Each group is a 64-byte
+    // aligned struct, so its size is padded to whole cache lines: the
+    // per-method counters share one line and the error counter gets its own.
+    // Static storage starts zeroed, so the members need no initializers.
+    struct alignas(64) MethodCounts {
+        std::atomic<int> left;
+        std::atomic<int> right;
+        std::atomic<int> forward;
+    };
+    struct alignas(64) ErrorCounts {
+        std::atomic<int> order;
+    };
+    static inline MethodCounts method_counts;
+    static inline ErrorCounts error_counts;
 
 private:
     bool left_ready_{false};
@@ -218,26 +228,26 @@ private:
 };
 
 inline int GetMethodDispatchLeftCount() {
-    return MethodDispatchRecorder::left_count.load();
+    return MethodDispatchRecorder::method_counts.left.load();
 }
 
 inline int GetMethodDispatchRightCount() {
-    return MethodDispatchRecorder::right_count.load();
+    return MethodDispatchRecorder::method_counts.right.load();
 }
 
 inline int GetMethodDispatchForwardCount() {
-    return MethodDispatchRecorder::forward_count.load();
+    return MethodDispatchRecorder::method_counts.forward.load();
 }
 
 inline int GetMethodDispatchOrderErrorCount() {
-    return MethodDispatchRecorder::order_error_count.load();
+    return MethodDispatchRecorder::error_counts.order.load();
 }
 
 inline void ResetMethodDispatchCounts() {
-    MethodDispatchRecorder::left_count.store(0);
-    MethodDispatchRecorder::right_count.store(0);
-    MethodDispatchRecorder::forward_count.store(0);
-    MethodDispatchRecorder::order_error_count.store(0);
+    MethodDispatchRecorder::method_counts.left.store(0);
+    MethodDispatchRecorder::method_counts.right.store(0);
+    MethodDispatchRecorder::method_counts.forward.store(0);
+    MethodDispatchRecorder::error_counts.order.store(0);
 }
 
 EW_REGISTER_NODE(MethodDispatchRecorder, "MethodDispatchRecorder")
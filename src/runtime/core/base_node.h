@@ -39,7 +39,7 @@ public:
         graph_ = &g;
         g.RegisterNode(this);
         task_ = g.taskflow.emplace([this]() { RunDispatch(); });
-        task_.name(TypeInfo::create<Derived>().type_name);
+        task_.name(demangled_name<Derived>());
     }
 
     NodeTypeInfo get_type_info() const override {
@@ -51,8 +51,14 @@ public:
         return info;
     }
 
+    // Built from the static method registry, so one copy serves every instance.
+    const NodeTypeInfo& cached_type_info() const override {
+        static const NodeTypeInfo info = get_type_info();
+        return info;
+    }
+
     std::string type_name() const override {
-        return TypeInfo::create<Derived>().type_name;
+        return demangled_name<Derived>();
     }
 
     void connect() override {
@@ -27,12 +27,22 @@ public:
     ErrorPolicy error_policy{ErrorPolicy::FailFast};
 
     void Reset() {
+        Rewind();
+        ClearTopology();
+    }
+
+    // Drop the built tasks and registered nodes; nodes must be built again.
+    void ClearTopology() {
         taskflow.clear();
+        nodes_.clear();
+    }
+
+    // Clear run state but keep the built tasks so the same graph can run again.
+    void Rewind() {
         keep_running = true;
         skip_current = false;
         locked = false;
         ClearErrors();
-        nodes_.clear();
     }
 
     void SetErrorPolicy(ErrorPolicy policy) {
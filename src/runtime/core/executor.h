@@ -27,6 +27,27 @@ public:
         }
     }
 
+    // Build `build_nodes` into `g`, then connect and activate every node in `nodes`.
+    void materialize(ExecutionGraph& g,
+                     const std::vector<Node*>& build_nodes,
+                     const std::vector<Node*>& nodes) {
+        for (auto* node : build_nodes) {
+            if (node) {
+                node->build(g);
+            }
+        }
+        for (auto* node : nodes) {
+            if (node) {
+                node->connect();
+            }
+        }
+        for (auto* node : nodes) {
+            if (node) {
+                node->Activate();
+            }
+        }
+    }
+
     void run(ExecutionGraph& g) {
         g.keep_running = true;
         g.Lock();
@@ -41,10 +62,13 @@ public:
             g.executor.run(g.taskflow).wait();
             if (g.skip_current && g.error_policy == ErrorPolicy::SkipCurrentData) {
                 g.ClearOutputsAndBuffers();
-                LogRuntime(RuntimeLogLevel::Warn, "Skipped current data after error", {
-                    {"event", "skip_current_data"},
-                    {"error_code", "EW_SKIP_CURRENT_DATA"},
-                });
+                // Per-iteration path: don't build the fields map when filtered out.
+                if (RuntimeLogEnabled(RuntimeLogLevel::Warn)) {
+                    LogRuntime(RuntimeLogLevel::Warn, "Skipped current data after error", {
+                        {"event", "skip_current_data"},
+                        {"error_code", "EW_SKIP_CURRENT_DATA"},
+                    });
+                }
             }
         }
         const auto elapsed_ms = std::chrono::duration_cast<std::chrono::milliseconds>(
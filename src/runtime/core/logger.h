@@ -42,7 +42,7 @@ public:
                    std::string file_path = {},
                    std::string trace_id = {}) {
         std::lock_guard<std::mutex> lock(mutex_);
-        level_ = level;
+        level_.store(level, std::memory_order_relaxed);
         format_ = format;
         if (trace_id.empty()) {
             trace_id_ = BuildDefaultTraceId();
@@ -60,7 +60,12 @@ public:
     }
 
     RuntimeLogLevel Level() const {
-        return level_;
+        return level_.load(std::memory_order_relaxed);
+    }
+
+    // Lets call sites skip building their fields map for filtered-out levels.
+    bool Enabled(RuntimeLogLevel level) const {
+        return level >= Level();
     }
 
     RuntimeLogFormat Format() const {
@@ -70,7 +75,7 @@ public:
     void Log(RuntimeLogLevel level,
              std::string_view message,
              std::unordered_map<std::string, std::string> fields = {}) {
-        if (level < level_) {
+        if (!Enabled(level)) {
             return;
         }
         std::lock_guard<std::mutex> lock(mutex_);
@@ -187,7 +192,7 @@ private:
     }
 
     mutable std::mutex mutex_;
-    RuntimeLogLevel level_{RuntimeLogLevel::Info};
+    std::atomic<RuntimeLogLevel> level_{RuntimeLogLevel::Info};
     RuntimeLogFormat format_{RuntimeLogFormat::Text};
     std::string file_path_;
     std::string trace_id_{"ew-0"};
@@ -229,6 +234,10 @@ inline RuntimeLogFormat ParseRuntimeLogFormat(std::string value) {
     throw std::runtime_error("Unknown log format: " + value);
 }
 
+inline bool RuntimeLogEnabled(RuntimeLogLevel level) {
+    return RuntimeLogger::Instance().Enabled(level);
+}
+
 inline void LogRuntime(RuntimeLogLevel level,
                        std::string_view message,
                        std::unordered_map<std::string, std::string> fields = {}) {
@@ -5,6 +5,7 @@
 #include <deque>
 #include <limits>
 #include <memory>
+#include <optional>
 #include <stdexcept>
 #include <string>
 #include <unordered_map>
@@ -148,6 +149,12 @@ public:
         add_upstream(upstream, {}, arg_idx, true);
     }
 
+    void set_weak_inputs(const std::vector<Node*>& upstreams, int arg_idx = -1) {
+        for (Node* upstream : upstreams) {
+            set_weak_input(upstream, arg_idx);
+        }
+    }
+
     virtual void set_input_for(const std::string& method, Node* upstream, int arg_idx = -1) {
         if (method.empty() || method == "forward") {
             set_input(upstream, arg_idx);
@@ -156,6 +163,12 @@ public:
         add_upstream(upstream, method, arg_idx);
     }
 
+    void set_inputs_for(const std::string& method, const std::vector<std::pair<Node*, int>>& inputs) {
+        for (const auto& [upstream, arg_idx] : inputs) {
+            set_input_for(method, upstream, arg_idx);
+        }
+    }
+
     void SetInputMux(const std::string& method,
                      int arg_idx,
                      Node* control,
@@ -202,6 +215,16 @@ public:
 
     virtual NodeTypeInfo get_type_info() const = 0;
 
+    // Type info is fixed once a node is constructed. Computed on first use;
+    // callers must not race the first call (graph construction is single-threaded).
+    // Nodes whose type info is fixed per C++ type may return a shared instance.
+    virtual const NodeTypeInfo& cached_type_info() const {
+        if (!type_info_cache_) {
+            type_info_cache_ = get_type_info();
+        }
+        return *type_info_cache_;
+    }
+
     virtual std::string type_name() const {
         return "Node";
     }
@@ -354,13 +377,13 @@ protected:
     }
 
     static int DecodeMuxChoiceDefault(const Packet& control_pkt) {
-        if (control_pkt.type() == TypeInfo::create<bool>()) {
+        if (control_pkt.holds<bool>()) {
             return control_pkt.cast<bool>() ? 0 : 1;
         }
-        if (control_pkt.type() == TypeInfo::create<int>()) {
+        if (control_pkt.holds<int>()) {
             return control_pkt.cast<int>();
         }
-        if (control_pkt.type() == TypeInfo::create<int64_t>()) {
+        if (control_pkt.holds<int64_t>()) {
             return static_cast<int>(control_pkt.cast<int64_t>());
         }
         throw std::runtime_error("Mux control packet must be bool or int");
@@ -565,6 +588,7 @@ private:
     bool opened_{false};
     mutable std::vector<Node*> upstream_nodes_;
     std::vector<uint8_t> dispatch_control_marks_;
+    mutable std::optional<NodeTypeInfo> type_info_cache_;
 };
 
 } // namespace easywork
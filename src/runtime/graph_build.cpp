@@ -122,14 +122,16 @@ void GraphBuild::Connect(const std::string& from_id, const std::string& from_met
     }
 
     to_node->set_input_for(to_method, from_node.get(), arg_idx);
-    LogRuntime(RuntimeLogLevel::Debug, "Graph edge connected", {
-        {"event", "graph_connect"},
-        {"from_node", from_id},
-        {"from_method", from_method},
-        {"to_node", to_id},
-        {"to_method", to_method},
-        {"arg_idx", std::to_string(arg_idx)},
-    });
+    if (RuntimeLogEnabled(RuntimeLogLevel::Debug)) {
+        LogRuntime(RuntimeLogLevel::Debug, "Graph edge connected", {
+            {"event", "graph_connect"},
+            {"from_node", from_id},
+            {"from_method", from_method},
+            {"to_node", to_id},
+            {"to_method", to_method},
+            {"arg_idx", std::to_string(arg_idx)},
+        });
+    }
 }
 
 void GraphBuild::SetInputMux(const std::string& consumer_id, const std::string& method,
@@ -321,15 +323,12 @@ void GraphBuild::BuildGraph() {
         {"event", "graph_build_start"},
         {"node_count", std::to_string(nodes_in_order_.size())},
     });
+    std::vector<Node*> raw_nodes;
+    raw_nodes.reserve(nodes_in_order_.size());
     for (const auto& node : nodes_in_order_) {
-        node->build(graph_);
-    }
-    for (const auto& node : nodes_in_order_) {
-        node->connect();
-    }
-    for (const auto& node : nodes_in_order_) {
-        node->Activate();
+        raw_nodes.push_back(node.get());
     }
+    executor_.materialize(graph_, raw_nodes, raw_nodes);
     built_ = true;
     LogRuntime(RuntimeLogLevel::Info, "Graph build completed", {
         {"event", "graph_build_finish"},
@@ -65,6 +65,7 @@ public:
 
     void RegisterAny(std::string_view name, NodeCreatorAny creator) {
         creators_any_[std::string(name)] = std::move(creator);
+        ++generation_;
     }
 
     std::shared_ptr<Node> CreateAny(std::string_view name,
@@ -80,6 +81,7 @@ public:
 #ifdef EASYWORK_ENABLE_PYBIND
     void Register(std::string_view name, NodeCreator creator) {
         creators_[std::string(name)] = std::move(creator);
+        ++generation_;
     }
 
     std::shared_ptr<Node> Create(std::string_view name,
@@ -115,8 +117,12 @@ public:
 #endif
     }
 
+    // Bumped on every registration, so callers can cache RegisteredNodes().
+    [[nodiscard]] std::size_t Generation() const { return generation_; }
+
 private:
     NodeRegistry() = default;
+    std::size_t generation_{0};
     std::unordered_map<std::string, NodeCreatorAny> creators_any_;
 #ifdef EASYWORK_ENABLE_PYBIND
     std::unordered_map<std::string, NodeCreator> creators_;
@@ -57,6 +57,27 @@ inline std::string demangle(const char* name) {
 #endif
 }
 
+// Demangled names, computed once per type. unordered_map nodes are stable,
+// so the returned reference stays valid for the life of the process.
+inline const std::string& demangled_name(const std::type_info& info) {
+    static std::mutex mutex;
+    static std::unordered_map<std::type_index, std::string> names;
+    std::lock_guard<std::mutex> lock(mutex);
+    auto it = names.find(std::type_index(info));
+    if (it == names.end()) {
+        it = names.emplace(std::type_index(info), demangle(info.name())).first;
+    }
+    return it->second;
+}
+
+// Per-type front for demangled_name(): only the first call for T takes the
+// lock, later calls read a function-local static.
+template <typename T>
+const std::string& demangled_name() {
+    static const std::string& name = demangled_name(typeid(T));
+    return name;
+}
+
 // ========== Compile-time String Hashing ==========
 
 constexpr std::size_t hash_string(std::string_view str) noexcept {
@@ -79,14 +100,17 @@ struct TypeInfo {
 
     template<typename T>
     static TypeInfo create() {
-        return from(typeid(T));
+        // Built once per T, so hot paths (e.g. mux control checks on worker
+        // threads) copy a cached descriptor instead of taking the name lock.
+        static const TypeInfo info = from(typeid(T));
+        return info;
     }
 
     static TypeInfo from(const std::type_info& info) {
         TypeInfo out;
         out.type_info = &info;
         out.type_index = std::type_index(info);
-        out.type_name = demangle(info.name());
+        out.type_name = demangled_name(info);
         return out;
     }
 
@@ -209,6 +233,13 @@ struct Packet {
         return payload ? TypeInfo::from(payload->type()) : TypeInfo::create<void>();
     }
 
+    // Cheap exact-type test: compares type_info directly, without building a
+    // TypeInfo (and its demangled name) for the payload.
+    template<typename T>
+    bool holds() const {
+        return payload && payload->type() == typeid(T);
+    }
+
     const std::any& data() const {
         if (!payload) {
             throw std::runtime_error("Cannot access empty Packet payload");
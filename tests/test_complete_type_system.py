@@ -32,6 +32,7 @@ def test_basic_typed_nodes():
 
     mult_type = pipeline.multiplier.raw.type_info
     assert [t.name for t in mult_type.methods[ew._core.ID_FORWARD].input_types] == ["int"]
+    assert isinstance(mult_type.methods[ew._core.ID_FORWARD].input_types, tuple)
     assert mult_type.methods[ew._core.ID_FORWARD].output_type.name == "int"
 
     pipeline.validate()
@@ -75,6 +76,36 @@ def test_node_type_info():
     assert type_info.methods[ew._core.ID_FORWARD].output_type.name == "int"
 
 
+def test_type_info_id_and_hash():
+    """测试 TypeInfo 的整数标识与哈希"""
+    source_out = ew.module.NumberSource(0, 1, 1).raw.type_info.methods[ew._core.ID_FORWARD].output_type
+    mult_in = ew.module.MultiplyBy(2).raw.type_info.methods[ew._core.ID_FORWARD].input_types[0]
+    text_out = ew.module.IntToText().raw.type_info.methods[ew._core.ID_FORWARD].output_type
+
+    assert source_out is not mult_in
+    assert source_out.id == mult_in.id
+    assert source_out.id != text_out.id
+    assert len({source_out, mult_in, text_out}) == 2
+
+
+def test_wrapper_caches_type_info():
+    """测试 NodeWrapper 缓存 type_info"""
+    multiplier = ew.module.MultiplyBy(2)
+    assert multiplier.raw.type_info is multiplier.raw.type_info
+    assert multiplier.type_info is multiplier.type_info
+    assert ew._core.ID_FORWARD in multiplier.type_info.methods
+
+
+def test_method_table_shared_per_type():
+    """测试同一 C++ 类型的节点共享方法签名表"""
+    double = ew.module.MultiplyBy(2)
+    triple = ew.module.MultiplyBy(3)
+    text = ew.module.IntToText()
+    assert double._method_types() is triple._method_types()
+    assert double.raw.type_info is triple.raw.type_info
+    assert text._method_types() is not double._method_types()
+
+
 # ========== 测试 4：Symbol 和连接 ==========
 
 def test_symbol_connections():
@@ -85,6 +116,7 @@ def test_symbol_connections():
     symbol = ew.Symbol(counter.raw)
     assert symbol.producer_node is counter.raw
     assert symbol.tuple_index is None
+    assert not hasattr(symbol, "__dict__")
 
     assert isinstance(counter, ew.NodeWrapper)
     assert counter.built is False
@@ -100,6 +132,9 @@ def test_module_dynamic_access():
 
     with pytest.raises(AttributeError):
         _ = ew.module.NonExistentNode
+    assert not hasattr(ew.module, "__wrapped__")
+
+    assert ew.module.NumberSource is ew.module.NumberSource
 
 
 def test_invalid_node_args_raise():
@@ -132,6 +167,28 @@ def test_tuple_auto_index_and_multi_input():
     pipeline.close()
 
 
+def test_tuple_fanout_shares_tuple_get_node():
+    """测试同一 tuple 元素被多次消费时只创建一个 TupleGet 节点"""
+    class FanoutPipeline(ew.Pipeline):
+        def __init__(self):
+            super().__init__()
+            self.emitter = ew.module.PairEmitter(start=1, max=3)
+            self.double = ew.module.MultiplyBy(factor=2)
+            self.triple = ew.module.MultiplyBy(factor=3)
+
+        def construct(self):
+            number, _ = self.emitter.read()
+            self.double(number)
+            self.triple(number)
+
+    pipeline = FanoutPipeline()
+    pipeline.validate()
+    assert len(pipeline._internal_nodes) == 1
+    pipeline.open()
+    pipeline.run()
+    pipeline.close()
+
+
 def test_mux_control_type_error_construct():
     pipeline = ew.Pipeline()
     source = ew.module.NumberSource(0, 1, 1)
@@ -157,6 +214,10 @@ def test_tuple_auto_registration():
     output_type = type_info.methods[ew._core.ID_FORWARD].output_type
     assert ew._core.get_tuple_size(output_type) == 2
 
+    first, second = ew.Symbol(emitter.raw)
+    assert (first.tuple_index, second.tuple_index) == (0, 1)
+    assert first.output_type.id == output_type.id
+
 
 # ========== 测试 8：Small Buffer 析构安全 ==========
 
@@ -172,16 +233,17 @@ def test_small_buffer_safety():
             value = self.source.read()
             self.consumer(value)
 
-    ew._core.reset_small_tracked_live_count()
-    pipeline = SmallTrackedPipeline()
-    pipeline.validate()
-    pipeline.open()
-    pipeline.run()
-    pipeline.close()
+    def _run():
+        pipeline = SmallTrackedPipeline()
+        pipeline.validate()
+        pipeline.open()
+        pipeline.run()
+        pipeline.close()
 
-    del pipeline
-    import gc
-    gc.collect()
+    ew._core.reset_small_tracked_live_count()
+    # Refcounting alone must release every packet once the pipeline goes out
+    # of scope; no gc.collect() so a reference cycle would fail the test.
+    _run()
 
     live_count = ew._core.get_small_tracked_live_count()
     assert live_count == 0
@@ -263,3 +325,17 @@ def test_open_required_and_args():
     pipeline.consumer.open()
     pipeline.run()
     pipeline.close()
+    assert not pipeline.source.is_open
+
+
+def test_run_requires_open_nodes():
+    pipeline = ew.Pipeline()
+    source = ew.module.NumberSource(0, 1, 1)
+    multiplier = ew.module.MultiplyBy(2)
+
+    with pipeline:
+        multiplier(source.read())
+
+    source.open()
+    with pytest.raises(RuntimeError, match="Closed nodes: .*MultiplyBy"):
+        pipeline.run()
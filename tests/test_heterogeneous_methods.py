@@ -86,3 +86,32 @@ def test_void_return_connection():
         pipeline.validate()
         
     assert "Type mismatch" in str(excinfo.value)
+
+
+def test_method_ids_match_core_hash():
+    """Python-side method IDs must agree with the C++ FNV-1a hash."""
+    assert ew.hash_string("forward") == ew._core.ID_FORWARD
+    assert ew.ID_FORWARD == ew._core.ID_FORWARD
+    assert ew.hash_string("Open") == ew._core.ID_OPEN
+    for name in ("set_string", "compute_ratio"):
+        assert ew.hash_string(name) == ew._hash_string_py(name)
+
+    node = ew.module.MixedNode()
+    assert node._method_name_to_id["set_string"] == ew.hash_string("set_string")
+
+
+def test_method_id_maps_shared_per_type():
+    first = ew.module.MixedNode()
+    second = ew.module.MixedNode()
+    assert first._method_name_to_id is second._method_name_to_id
+    assert first._id_to_method_name[ew._core.ID_FORWARD] == "forward"
+
+
+def test_method_proxies_bound_at_construction():
+    node = ew.module.MixedNode()
+    other = ew.module.MixedNode()
+    assert type(node) is type(other)
+    assert isinstance(node, ew.NodeWrapper)
+    assert "set_string" in vars(type(node))
+    assert "open" not in vars(type(node))
+    assert not hasattr(node, "__dict__")